@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+from array import array
 from collections import deque
 from dataclasses import dataclass
 from heapq import heappop, heappush
-from math import sqrt
+from itertools import count
+from math import hypot, inf, sqrt
 from typing import Dict, Hashable, Iterable, List, Optional, Tuple
 
 
 Node = Hashable
+# (node_list, node_index, adj_list) as returned by index_adjacency
+AdjacencyIndex = Tuple[List[Node], Dict[Node, int], List[List[int]]]
 
 
 @dataclass
@@ -18,113 +22,334 @@ class SearchResult:
     visited_order: Optional[List[Node]] = None
 
 
+def index_adjacency(adjacency: Dict[Node, Iterable[Node]]) -> AdjacencyIndex:
+    """
+    Reindex arbitrary hashable nodes to 0..n-1 so the traversal loops can use
+    integer lists instead of hashing node objects on every edge visit.
+
+    Returns (node_list, node_index, adj_list) where adj_list[i] holds the
+    integer ids of node_list[i]'s neighbors. Neighbors that have no adjacency
+    entry of their own still get an id (with no outgoing edges), so e.g.
+    {1: [2]} is a valid input.
+    """
+    node_list: List[Node] = list(adjacency)
+    node_index: Dict[Node, int] = {n: i for i, n in enumerate(node_list)}
+    adj_list: List[List[int]] = []
+    for n in adjacency:
+        row: List[int] = []
+        for m in adjacency[n]:
+            j = node_index.get(m)
+            if j is None:
+                j = len(node_list)
+                node_index[m] = j
+                node_list.append(m)
+            row.append(j)
+        adj_list.append(row)
+    # Dangling neighbors were appended after the keyed nodes; give them
+    # empty neighbor rows so adj_list stays aligned with node_list.
+    while len(adj_list) < len(node_list):
+        adj_list.append([])
+    return node_list, node_index, adj_list
+
+
 def reconstruct_path(came_from: Dict[Node, Optional[Node]], start: Node, goal: Node) -> List[Node]:
-    path: List[Node] = []
+    # appendleft builds the path in order directly, avoiding the
+    # append-then-reverse pass (and its extra O(len) copy).
+    path: deque[Node] = deque()
     current: Optional[Node] = goal
     while current is not None:
-        path.append(current)
-        current = came_from[current]
-    path.reverse()
+        path.appendleft(current)
+        current = came_from.get(current)
     # Validate that the path actually starts at start
     if not path or path[0] != start:
         return []
+    return list(path)
+
+
+def _path_from_parents(parent: "array[int]", node_list: List[Node], start_idx: int, goal_idx: int) -> List[Node]:
+    # Count the hops first so the output list is allocated exactly once and
+    # filled back-to-front -- no reversal, no reallocation.
+    depth = 0
+    current = goal_idx
+    while current != -1:
+        depth += 1
+        current = parent[current]
+    path: List[Node] = [None] * depth  # type: ignore[list-item]
+    current = goal_idx
+    for i in range(depth - 1, -1, -1):
+        path[i] = node_list[current]
+        current = parent[current]
+    if not path or path[0] != node_list[start_idx]:
+        return []
     return path
 
 
-def bfs(adjacency: Dict[Node, Iterable[Node]], start: Node, goal: Node) -> SearchResult:
+def bfs(
+    adjacency: Dict[Node, Iterable[Node]],
+    start: Node,
+    goal: Node,
+    track_order: bool = False,
+    index: Optional[AdjacencyIndex] = None,
+) -> SearchResult:
     """
     Breadth-First Search for unweighted shortest path (by number of edges).
     """
-    frontier: deque[Node] = deque([start])
-    came_from: Dict[Node, Optional[Node]] = {start: None}
+    # Reuse a caller-provided index (Graph precomputes one) when available
+    node_list, node_index, adj_list = index if index is not None else index_adjacency(adjacency)
+    if start not in node_index:
+        return SearchResult(path=[], distance=0, visited_count=0, visited_order=[] if track_order else None)
+    start_idx = node_index[start]
+    goal_idx = node_index.get(goal, -1)
+
+    n = len(node_list)
+    frontier: deque[int] = deque([start_idx])
+    parent = array('i', [-1] * n)
+    visited = bytearray(n)
+    visited[start_idx] = 1
     visited_count = 0
 
-    visited_order: List[Node] = []
+    # visited_order costs an append per pop; skip it unless asked for
+    visited_order: Optional[List[Node]] = [] if track_order else None
+    order_append = visited_order.append if track_order else None
+    # Bind hot bound methods once; saves an attribute lookup per iteration.
+    popleft = frontier.popleft
+    append = frontier.append
     while frontier:
-        current = frontier.popleft()
+        current = popleft()
         visited_count += 1
-        visited_order.append(current)
-        if current == goal:
+        if order_append is not None:
+            order_append(node_list[current])
+        if current == goal_idx:
             break
-        for neighbor in adjacency.get(current, []):
-            if neighbor not in came_from:
-                came_from[neighbor] = current
-                frontier.append(neighbor)
+        for nb in adj_list[current]:
+            if not visited[nb]:
+                visited[nb] = 1
+                parent[nb] = current
+                append(nb)
 
-    path = reconstruct_path(came_from, start, goal)
+    path = _path_from_parents(parent, node_list, start_idx, goal_idx) if goal_idx != -1 else []
     distance = max(0, len(path) - 1)
     return SearchResult(path=path, distance=distance, visited_count=visited_count, visited_order=visited_order)
 
 
-def dfs(adjacency: Dict[Node, Iterable[Node]], start: Node, goal: Node) -> SearchResult:
+def dfs(
+    adjacency: Dict[Node, Iterable[Node]],
+    start: Node,
+    goal: Node,
+    track_order: bool = False,
+    index: Optional[AdjacencyIndex] = None,
+) -> SearchResult:
     """
     Depth-First Search. Not guaranteed to find the shortest path, but returns a valid path if one exists.
     Distance reported is number of edges along the found path.
     """
-    stack: List[Node] = [start]
-    came_from: Dict[Node, Optional[Node]] = {start: None}
+    # Reuse a caller-provided index (Graph precomputes one) when available
+    node_list, node_index, adj_list = index if index is not None else index_adjacency(adjacency)
+    if start not in node_index:
+        return SearchResult(path=[], distance=0, visited_count=0, visited_order=[] if track_order else None)
+    start_idx = node_index[start]
+    goal_idx = node_index.get(goal, -1)
+
+    n = len(node_list)
+    stack: List[int] = [start_idx]
+    parent = array('i', [-1] * n)
+    visited = bytearray(n)
+    visited[start_idx] = 1
     visited_count = 0
 
-    visited_order: List[Node] = []
+    # visited_order costs an append per pop; skip it unless asked for
+    visited_order: Optional[List[Node]] = [] if track_order else None
+    order_append = visited_order.append if track_order else None
+    # Bind hot bound methods once; saves an attribute lookup per iteration.
+    pop = stack.pop
+    append = stack.append
     while stack:
-        current = stack.pop()
+        current = pop()
         visited_count += 1
-        visited_order.append(current)
-        if current == goal:
+        if order_append is not None:
+            order_append(node_list[current])
+        if current == goal_idx:
             break
-        for neighbor in adjacency.get(current, []):
-            if neighbor not in came_from:
-                came_from[neighbor] = current
-                stack.append(neighbor)
+        for nb in adj_list[current]:
+            if not visited[nb]:
+                visited[nb] = 1
+                parent[nb] = current
+                append(nb)
 
-    path = reconstruct_path(came_from, start, goal)
+    path = _path_from_parents(parent, node_list, start_idx, goal_idx) if goal_idx != -1 else []
     distance = max(0, len(path) - 1)
     return SearchResult(path=path, distance=distance, visited_count=visited_count, visited_order=visited_order)
 
 
+def bidir_bfs(
+    adjacency: Dict[Node, Iterable[Node]],
+    start: Node,
+    goal: Node,
+    track_order: bool = False,
+    index: Optional[AdjacencyIndex] = None,
+) -> SearchResult:
+    """
+    Bidirectional BFS: grow one frontier from the start and one from the goal,
+    always expanding the smaller side, and stitch the path where they meet.
+    Expands on the order of 2*b^(d/2) nodes versus BFS's b^d.
+    """
+    # Reuse a caller-provided index (Graph precomputes one) when available
+    node_list, node_index, adj_list = index if index is not None else index_adjacency(adjacency)
+    if start not in node_index or goal not in node_index:
+        return SearchResult(path=[], distance=0, visited_count=0, visited_order=[] if track_order else None)
+    start_idx = node_index[start]
+    goal_idx = node_index[goal]
+    if start_idx == goal_idx:
+        return SearchResult(path=[start], distance=0, visited_count=1, visited_order=[start] if track_order else None)
+
+    n = len(node_list)
+    frontier_f: deque[int] = deque([start_idx])
+    frontier_b: deque[int] = deque([goal_idx])
+    parent_f = array('i', [-1] * n)
+    parent_b = array('i', [-1] * n)
+    visited_f = bytearray(n)
+    visited_b = bytearray(n)
+    visited_f[start_idx] = 1
+    visited_b[goal_idx] = 1
+    visited_count = 0
+    meet = -1
+
+    # visited_order costs an append per pop; skip it unless asked for
+    visited_order: Optional[List[Node]] = [] if track_order else None
+    order_append = visited_order.append if track_order else None
+    while frontier_f and frontier_b and meet == -1:
+        # Expand the smaller frontier one full level
+        if len(frontier_f) <= len(frontier_b):
+            frontier, visited, other_visited, parent = frontier_f, visited_f, visited_b, parent_f
+        else:
+            frontier, visited, other_visited, parent = frontier_b, visited_b, visited_f, parent_b
+        for _ in range(len(frontier)):
+            current = frontier.popleft()
+            visited_count += 1
+            if order_append is not None:
+                order_append(node_list[current])
+            for nb in adj_list[current]:
+                if not visited[nb]:
+                    visited[nb] = 1
+                    parent[nb] = current
+                    if other_visited[nb]:
+                        meet = nb
+                        break
+                    frontier.append(nb)
+            if meet != -1:
+                break
+
+    if meet == -1:
+        return SearchResult(path=[], distance=0, visited_count=visited_count, visited_order=visited_order)
+
+    # Walk back to the start from the meeting node, then forward to the goal
+    path: List[Node] = []
+    current = meet
+    while current != -1:
+        path.append(node_list[current])
+        current = parent_f[current]
+    path.reverse()
+    current = parent_b[meet]
+    while current != -1:
+        path.append(node_list[current])
+        current = parent_b[current]
+    return SearchResult(path=path, distance=len(path) - 1, visited_count=visited_count, visited_order=visited_order)
+
+
 def euclidean(a: Tuple[float, float], b: Tuple[float, float]) -> float:
     return sqrt((a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2)
 
 
+_OCTILE_FACTOR = sqrt(2.0) - 2.0
+
+
 def astar(
     adjacency: Dict[Node, Iterable[Node]],
     positions: Dict[Node, Tuple[float, float]],
     start: Node,
     goal: Node,
+    heuristic_kind: str = "euclidean",
+    track_order: bool = False,
+    index: Optional[AdjacencyIndex] = None,
 ) -> SearchResult:
     """
-    A* pathfinding with unit edge costs and Euclidean heuristic from provided positions.
+    A* pathfinding with unit edge costs and a heuristic from provided positions.
+
+    heuristic_kind selects "euclidean" (default) or "octile"; octile is
+    sqrt-free (two adds, one min, one multiply) and suits grid-shaped graphs
+    where moves are axis-aligned.
     """
-    open_heap: List[Tuple[float, Node]] = []
-    heappush(open_heap, (0.0, start))
+    # Reuse a caller-provided index (Graph precomputes one) when available
+    node_list, node_index, adj_list = index if index is not None else index_adjacency(adjacency)
+    if start not in node_index:
+        return SearchResult(path=[], distance=0, visited_count=0, visited_order=[] if track_order else None)
+    start_idx = node_index[start]
+    goal_idx = node_index.get(goal, -1)
 
-    came_from: Dict[Node, Optional[Node]] = {start: None}
-    g_score: Dict[Node, float] = {start: 0.0}
+    n = len(node_list)
+
+    # Heuristic values are query-invariant (the goal is fixed), so build the
+    # whole goal-distance table up front in one pass; the cost is amortized
+    # across every relaxation and the inner loop becomes a plain list index.
+    goal_pos = positions.get(goal)
+    h_table: List[float] = [0.0] * n
+    if goal_pos is not None:
+        gx, gy = goal_pos
+        if heuristic_kind == "octile":
+            for i, node in enumerate(node_list):
+                pos = positions.get(node)
+                if pos is not None:
+                    dx = abs(pos[0] - gx)
+                    dy = abs(pos[1] - gy)
+                    h_table[i] = dx + dy + _OCTILE_FACTOR * min(dx, dy)
+        else:
+            for i, node in enumerate(node_list):
+                pos = positions.get(node)
+                if pos is not None:
+                    h_table[i] = hypot(pos[0] - gx, pos[1] - gy)
+
+    # Heap entries are (f, tiebreak, node); the monotonically increasing
+    # tiebreak keeps heapq from ever comparing entries beyond f ties.
+    counter = count()
+    open_heap: List[Tuple[float, int, int]] = []
+    heappush(open_heap, (0.0, next(counter), start_idx))
+
+    parent = array('i', [-1] * n)
+    g_score: List[float] = [inf] * n
+    g_score[start_idx] = 0.0
+    closed = bytearray(n)
     visited_count = 0
 
-    visited_order: List[Node] = []
+    # visited_order costs an append per pop; skip it unless asked for
+    visited_order: Optional[List[Node]] = [] if track_order else None
+    order_append = visited_order.append if track_order else None
+    # Bind the heap helpers locally for the hot loop.
+    push = heappush
+    pop = heappop
     while open_heap:
-        _, current = heappop(open_heap)
+        _, _, current = pop(open_heap)
+        if closed[current]:
+            # Stale entry: a shorter route to this node was already expanded.
+            continue
+        closed[current] = 1
         visited_count += 1
-        visited_order.append(current)
-        if current == goal:
-            path = reconstruct_path(came_from, start, goal)
+        if order_append is not None:
+            order_append(node_list[current])
+        if current == goal_idx:
+            path = _path_from_parents(parent, node_list, start_idx, goal_idx)
             return SearchResult(path=path, distance=max(0, len(path) - 1), visited_count=visited_count, visited_order=visited_order)
 
-        for neighbor in adjacency.get(current, []):
-            tentative_g = g_score[current] + 1.0  # unit edge cost
-            if neighbor not in g_score or tentative_g < g_score[neighbor]:
-                came_from[neighbor] = current
-                g_score[neighbor] = tentative_g
-                h = (
-                    euclidean(positions[neighbor], positions[goal])
-                    if (neighbor in positions and goal in positions)
-                    else 0.0
-                )
-                f = tentative_g + h
-                heappush(open_heap, (f, neighbor))
+        tentative_g = g_score[current] + 1.0  # unit edge cost
+        for nb in adj_list[current]:
+            if tentative_g < g_score[nb]:
+                parent[nb] = current
+                g_score[nb] = tentative_g
+                # Reopen on improvement: the heuristic is not guaranteed
+                # consistent (e.g. the grid's diagonal shortcut edge), so an
+                # expanded node can still be reached more cheaply and must be
+                # eligible for re-expansion or paths come out longer.
+                closed[nb] = 0
+                push(open_heap, (tentative_g + h_table[nb], next(counter), nb))
 
     # If no path
     return SearchResult(path=[], distance=0, visited_count=visited_count, visited_order=visited_order)
-
-
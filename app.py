@@ -3,12 +3,13 @@ from __future__ import annotations
 import argparse
 from typing import Dict, List
 
-from algorithms import bfs, dfs, astar, SearchResult
+from algorithms import bfs, bidir_bfs, dfs, astar, SearchResult
 from graphs import get_all_graphs, Graph
 
 
 ALGORITHMS = {
     "bfs": bfs,
+    "bibfs": bidir_bfs,
     "dfs": dfs,
     "astar": astar,
 }
@@ -36,7 +37,7 @@ def run_cli() -> None:
     parser.add_argument("graph", choices=graphs.keys(), help="Graph to use")
     parser.add_argument("start", help="Start node (stringified; e.g., '(0, 0)' or 'A')")
     parser.add_argument("goal", help="Goal node (stringified)")
-    parser.add_argument("algorithm", choices=ALGORITHMS.keys(), help="Algorithm: bfs | dfs | astar")
+    parser.add_argument("algorithm", choices=ALGORITHMS.keys(), help="Algorithm: bfs | bibfs | dfs | astar")
     parser.add_argument("--list", action="store_true", help="List graphs and nodes")
 
     args = parser.parse_args()
@@ -66,10 +67,11 @@ def run_cli() -> None:
     if goal not in g.adjacency:
         raise SystemExit(f"Goal node {goal!r} not in selected graph")
 
+    index = (g.node_list, g.node_index, g.adj_list)
     if args.algorithm == "astar":
-        result: SearchResult = ALGORITHMS[args.algorithm](g.adjacency, g.positions, start, goal)
+        result: SearchResult = ALGORITHMS[args.algorithm](g.adjacency, g.positions, start, goal, index=index)
     else:
-        result = ALGORITHMS[args.algorithm](g.adjacency, start, goal)
+        result = ALGORITHMS[args.algorithm](g.adjacency, start, goal, index=index)
 
     print(f"Algorithm: {args.algorithm.upper()}")
     print(f"Graph: {args.graph}")
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from typing import Dict, Hashable, Iterable, Tuple
+from functools import lru_cache
+from math import cos, pi, sin
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+from algorithms import index_adjacency
 
 
 Node = Hashable
@@ -9,19 +13,51 @@ Position = Tuple[float, float]
 
 class Graph:
     def __init__(self, adjacency: Dict[Node, Iterable[Node]], positions: Dict[Node, Position]):
-        self.adjacency = {n: list(neigh) for n, neigh in adjacency.items()}
+        # Freeze neighbor containers to tuples: smaller than lists (no
+        # over-allocation), immutable, and marginally faster to iterate.
+        self.adjacency: Dict[Node, Tuple[Node, ...]] = {
+            n: tuple(neigh) for n, neigh in adjacency.items()
+        }
         self.positions = positions
-
-
-def _add_undirected_edge(adj: Dict[Node, list], a: Node, b: Node) -> None:
-    adj.setdefault(a, []).append(b)
-    adj.setdefault(b, []).append(a)
-
-
+        # Integer-indexed view for the search hot loops: node_list maps
+        # ids back to nodes, adj_list[i] holds neighbor ids of node_list[i].
+        self.node_list: List[Node]
+        self.node_index: Dict[Node, int]
+        self.adj_list: List[List[int]]
+        self.node_list, self.node_index, self.adj_list = index_adjacency(self.adjacency)
+        # Bounding box (min_x, min_y, max_x, max_y) so renderers do not
+        # re-scan every position per frame; None when there are no positions.
+        if self.positions:
+            xs = [p[0] for p in self.positions.values()]
+            ys = [p[1] for p in self.positions.values()]
+            self.bbox: Optional[Tuple[float, float, float, float]] = (min(xs), min(ys), max(xs), max(ys))
+        else:
+            self.bbox = None
+        # Display labels cached once per graph (the UI draws and parses these
+        # every frame/run), plus the reverse map for label -> node lookups.
+        self.node_labels: Dict[Node, str] = {n: str(n) for n in self.adjacency}
+        self.label_to_node: Dict[str, Node] = {label: n for n, label in self.node_labels.items()}
+
+
+# Unit-circle points for the two hexagon layers of hex_ring_12, computed once
+# at import time so graph building does no trigonometry.
+_HEX_OUTER_UNIT = tuple((cos(2 * pi * i / 6), sin(2 * pi * i / 6)) for i in range(6))
+_HEX_INNER_UNIT = tuple((cos(2 * pi * (i + 0.5) / 6), sin(2 * pi * (i + 0.5) / 6)) for i in range(6))
+
+
+def _add_undirected_edge(adj: Dict[Node, dict], a: Node, b: Node) -> None:
+    # Neighbor containers are dicts used as insertion-ordered sets during
+    # construction: O(1) add, O(1) removal via pop, and deterministic
+    # iteration order (unlike set). Graph.__init__ freezes them to tuples.
+    adj.setdefault(a, {})[b] = None
+    adj.setdefault(b, {})[a] = None
+
+
+@lru_cache(maxsize=1)
 def urban_grid_6x6() -> Graph:
     # 6x6 grid with some blocked edges and a few shortcuts to increase complexity
     size = 6
-    adjacency: Dict[Node, list] = {}
+    adjacency: Dict[Node, dict] = {}
     positions: Dict[Node, Position] = {}
     for r in range(size):
         for c in range(size):
@@ -37,20 +73,21 @@ def urban_grid_6x6() -> Graph:
     # block a few streets (reduced for lower complexity)
     blocked = [((1, 1), (1, 2)), ((2, 3), (3, 3))]
     for a, b in blocked:
-        if a in adjacency and b in adjacency[a]:
-            adjacency[a].remove(b)
-        if b in adjacency and a in adjacency[b]:
-            adjacency[b].remove(a)
+        if a in adjacency:
+            adjacency[a].pop(b, None)
+        if b in adjacency:
+            adjacency[b].pop(a, None)
     # add a single shortcut (reduced)
     for a, b in [((0, 0), (2, 2))]:
         _add_undirected_edge(adjacency, a, b)
     return Graph(adjacency, positions)
 
 
+@lru_cache(maxsize=1)
 def ladder_10() -> Graph:
     # Two parallel lines with rungs (ladder), 10 nodes total
     positions: Dict[Node, Position] = {}
-    adjacency: Dict[Node, list] = {}
+    adjacency: Dict[Node, dict] = {}
     # left rail L0..L4 and right rail R0..R4
     for i in range(5):
         L = f"L{i}"
@@ -64,15 +101,15 @@ def ladder_10() -> Graph:
     return Graph(adjacency, positions)
 
 
+@lru_cache(maxsize=1)
 def binary_tree_15() -> Graph:
     # Complete binary tree up to 15 nodes labeled 1..15
     positions: Dict[Node, Position] = {}
-    adjacency: Dict[Node, list] = {}
-    import math
+    adjacency: Dict[Node, dict] = {}
     for i in range(1, 16):
-        level = int(math.floor(math.log2(i)))
-        index_in_level = i - (1 << level)
+        level = i.bit_length() - 1  # floor(log2(i)) without float math
         nodes_in_level = 1 << level
+        index_in_level = i - nodes_in_level
         x = (index_in_level + 1) / (nodes_in_level + 1) * 10.0
         y = level * 2.0
         positions[i] = (x, -y)
@@ -85,19 +122,19 @@ def binary_tree_15() -> Graph:
     return Graph(adjacency, positions)
 
 
+@lru_cache(maxsize=1)
 def hex_ring_12() -> Graph:
     # 12 nodes arranged roughly on two hexagons with chords
-    import math
     positions: Dict[Node, Position] = {}
-    adjacency: Dict[Node, list] = {}
+    adjacency: Dict[Node, dict] = {}
     outer = [f"O{i}" for i in range(6)]
     inner = [f"I{i}" for i in range(6)]
     for i, name in enumerate(outer):
-        angle = 2 * math.pi * i / 6
-        positions[name] = (math.cos(angle) * 6.0, math.sin(angle) * 6.0)
+        ux, uy = _HEX_OUTER_UNIT[i]
+        positions[name] = (ux * 6.0, uy * 6.0)
     for i, name in enumerate(inner):
-        angle = 2 * math.pi * (i + 0.5) / 6
-        positions[name] = (math.cos(angle) * 3.5, math.sin(angle) * 3.5)
+        ux, uy = _HEX_INNER_UNIT[i]
+        positions[name] = (ux * 3.5, uy * 3.5)
     # ring connections
     for i in range(6):
         _add_undirected_edge(adjacency, outer[i], outer[(i + 1) % 6])
@@ -111,6 +148,7 @@ def hex_ring_12() -> Graph:
     return Graph(adjacency, positions)
 
 
+@lru_cache(maxsize=1)
 def campus_map() -> Graph:
     # Named places with criss-cross paths
     names = [
@@ -128,7 +166,7 @@ def campus_map() -> Graph:
         "Auditorium": (2.0, 3.5),
         "Hostel": (5.5, 2.5),
     }
-    adjacency: Dict[Node, list] = {}
+    adjacency: Dict[Node, dict] = {}
     for a, b in [
         ("Gate", "Admin"), ("Gate", "Parking"), ("Admin", "Library"), ("Admin", "Cafeteria"),
         ("Library", "Auditorium"), ("Library", "LabA"), ("Cafeteria", "LabB"), ("LabA", "LabB"),
@@ -138,6 +176,7 @@ def campus_map() -> Graph:
     return Graph(adjacency, positions)
 
 
+@lru_cache(maxsize=1)
 def get_all_graphs() -> Dict[str, Graph]:
     return {
         "UrbanGrid-6x6": urban_grid_6x6(),
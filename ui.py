@@ -5,7 +5,7 @@ from tkinter import ttk, messagebox
 from typing import Dict, Tuple, List, Hashable, Optional
 
 from graphs import get_all_graphs, Graph
-from algorithms import bfs, dfs, astar, SearchResult
+from algorithms import bfs, bidir_bfs, dfs, astar, SearchResult
 
 
 Node = Hashable
@@ -31,6 +31,7 @@ class GraphUI(tk.Tk):
         self.pan_x: float = 0.0
         self.pan_y: float = 0.0
         self._pan_last: Tuple[float, float] | None = None
+        self._redraw_pending: bool = False
         self._build_widgets()
         self._populate_nodes()
         self._draw_graph()
@@ -39,6 +40,12 @@ class GraphUI(tk.Tk):
         self.current_path: List[Node] = []
         self.visited_order: List[Node] = []
         self._step_index: int = 0
+        # path animation state consumed by _anim_tick
+        self._anim_path: List[Node] = []
+        self._anim_points: List[float] = []
+        self._anim_index: int = 0
+        self._anim_glow_item: Optional[int] = None
+        self._anim_core_item: Optional[int] = None
 
     def _build_widgets(self) -> None:
         # style
@@ -61,7 +68,7 @@ class GraphUI(tk.Tk):
 
         ttk.Label(control, text="Algorithm").pack(anchor=tk.W, pady=(8, 0))
         self.alg_combo = ttk.Combobox(control, state="readonly", textvariable=self.algorithm_name,
-                                      values=["bfs", "dfs", "astar"])
+                                      values=["bfs", "bibfs", "dfs", "astar"])
         self.alg_combo.pack(fill=tk.X)
 
         ttk.Label(control, text="Start node").pack(anchor=tk.W, pady=(8, 0))
@@ -120,7 +127,7 @@ class GraphUI(tk.Tk):
         self.canvas.bind("<ButtonPress-3>", self._pan_start)
         self.canvas.bind("<B3-Motion>", self._pan_move)
         self.canvas.bind("<ButtonRelease-3>", self._pan_end)
-        self.canvas.bind("<Configure>", lambda e: self._draw_graph())
+        self.canvas.bind("<Configure>", lambda e: self._schedule_redraw())
 
         self._apply_theme()
 
@@ -143,6 +150,17 @@ class GraphUI(tk.Tk):
         self.edge_color = edge
         self.text_color = fg
 
+    def _schedule_redraw(self) -> None:
+        # Coalesce bursts of zoom/pan/resize events into one redraw per idle
+        # tick instead of rebuilding the canvas synchronously for each event.
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._do_redraw)
+
+    def _do_redraw(self) -> None:
+        self._redraw_pending = False
+        self._draw_graph()
+
     def _on_graph_change(self, _event=None) -> None:
         self._populate_nodes()
         self._draw_graph()
@@ -150,8 +168,7 @@ class GraphUI(tk.Tk):
 
     def _populate_nodes(self) -> None:
         g = self.graphs[self.current_graph_name.get()]
-        nodes = list(g.adjacency.keys())
-        display_nodes = [self._node_to_str(n) for n in nodes]
+        display_nodes = [g.node_labels[n] for n in g.adjacency]
         self.start_combo["values"] = display_nodes
         self.goal_combo["values"] = display_nodes
         if display_nodes:
@@ -165,11 +182,8 @@ class GraphUI(tk.Tk):
         if not positions:
             return
 
-        # Compute bounding box and scaling
-        xs = [p[0] for p in positions.values()]
-        ys = [p[1] for p in positions.values()]
-        min_x, max_x = min(xs), max(xs)
-        min_y, max_y = min(ys), max(ys)
+        # Bounding box is precomputed on the Graph at build time
+        min_x, min_y, max_x, max_y = g.bbox
 
         pad = 40
         width = self.canvas.winfo_width() or 600
@@ -199,17 +213,24 @@ class GraphUI(tk.Tk):
             y = y * self.user_scale + self.pan_y
             return x, y
 
-        # Draw edges
+        # Project every node once per redraw; edges and nodes reuse the result
+        canvas_pos: Dict[Node, Tuple[float, float]] = {n: to_canvas(p) for n, p in positions.items()}
+
+        # Draw edges; adjacency stores both directions, so the index filter
+        # emits each undirected edge exactly once
+        node_index = g.node_index
         for n, neighbors in g.adjacency.items():
-            x1, y1 = to_canvas(positions[n])
+            x1, y1 = canvas_pos[n]
+            i = node_index[n]
             for m in neighbors:
-                x2, y2 = to_canvas(positions[m])
-                self.canvas.create_line(x1, y1, x2, y2, fill=self.edge_color)
+                if i < node_index[m]:
+                    x2, y2 = canvas_pos[m]
+                    self.canvas.create_line(x1, y1, x2, y2, fill=self.edge_color, tags="edge")
 
         # Draw nodes with glossy highlight (outer ring)
         self.node_items: Dict[Node, int] = {}
         for n, pos in positions.items():
-            x, y = to_canvas(pos)
+            x, y = canvas_pos[n]
             r = 10
             # outer glow ring
             self.canvas.create_oval(x - r - 3, y - r - 3, x + r + 3, y + r + 3, outline="#5dade2", width=1)
@@ -217,7 +238,7 @@ class GraphUI(tk.Tk):
             self.node_items[n] = item
             # small glossy reflection
             self.canvas.create_arc(x - r, y - r, x + r, y + r, start=45, extent=90, style=tk.ARC, outline="#bbdefb", width=2)
-            self.canvas.create_text(x, y - 16, text=self._node_to_str(n), fill=self.text_color, font=("Segoe UI", 10))
+            self.canvas.create_text(x, y - 16, text=g.node_labels[n], fill=self.text_color, font=("Segoe UI", 10))
 
     def _clear_path(self) -> None:
         if self.anim_after_id is not None:
@@ -241,12 +262,15 @@ class GraphUI(tk.Tk):
                 return
 
             algo = self.algorithm_name.get()
+            index = (g.node_list, g.node_index, g.adj_list)
             if algo == "astar":
-                result: SearchResult = astar(g.adjacency, g.positions, start, goal)
+                result: SearchResult = astar(g.adjacency, g.positions, start, goal, track_order=True, index=index)
             elif algo == "bfs":
-                result = bfs(g.adjacency, start, goal)
+                result = bfs(g.adjacency, start, goal, track_order=True, index=index)
+            elif algo == "bibfs":
+                result = bidir_bfs(g.adjacency, start, goal, track_order=True, index=index)
             else:
-                result = dfs(g.adjacency, start, goal)
+                result = dfs(g.adjacency, start, goal, track_order=True, index=index)
 
             if not result.path:
                 self.info_var.set("No path found")
@@ -279,25 +303,42 @@ class GraphUI(tk.Tk):
             y = y * self.user_scale + self.pan_y
             return x, y
 
-        # Animate sequentially with glow (draw wide translucent layer then bright core)
-        def step(i: int) -> None:
-            if i >= len(path) - 1:
-                # highlight start/goal
-                if path:
-                    self._highlight_node(path[0], fill="#43a047")
-                    self._highlight_node(path[-1], fill="#e53935")
-                return
-            a, b = path[i], path[i + 1]
-            x1, y1 = to_canvas(positions[a])
-            x2, y2 = to_canvas(positions[b])
-            # glow backdrop
-            self.canvas.create_line(x1, y1, x2, y2, width=8, fill="#ffd180")
-            # bright core
-            self.canvas.create_line(x1, y1, x2, y2, width=4, fill="#ff8f00")
-            self._highlight_node(a, fill="#64b5f6")
-            self.anim_after_id = self.after(self.speed_ms.get(), lambda: step(i + 1))
-
-        step(0)
+        # Project every path node once up front into a flat coordinate list;
+        # the ticker then just slices it instead of re-projecting per frame.
+        self._anim_path = path
+        points: List[float] = []
+        for node in path:
+            points.extend(to_canvas(positions[node]))
+        self._anim_points = points
+        self._anim_index = 0
+        self._anim_glow_item = None
+        self._anim_core_item = None
+        self._anim_tick()
+
+    def _anim_tick(self) -> None:
+        # Animate with glow: one polyline per layer (wide backdrop + bright
+        # core) for the entire path. The first tick creates the two items,
+        # later ticks extend them via coords() instead of stacking two new
+        # canvas items per segment.
+        path = self._anim_path
+        i = self._anim_index
+        if i >= len(path) - 1:
+            # highlight start/goal
+            if path:
+                self._highlight_node(path[0], fill="#43a047")
+                self._highlight_node(path[-1], fill="#e53935")
+            self.anim_after_id = None
+            return
+        pts = self._anim_points[: 2 * (i + 2)]
+        if self._anim_glow_item is None:
+            self._anim_glow_item = self.canvas.create_line(*pts, width=8, fill="#ffd180", capstyle=tk.ROUND)
+            self._anim_core_item = self.canvas.create_line(*pts, width=4, fill="#ff8f00", capstyle=tk.ROUND)
+        else:
+            self.canvas.coords(self._anim_glow_item, *pts)
+            self.canvas.coords(self._anim_core_item, *pts)
+        self._highlight_node(path[i], fill="#64b5f6")
+        self._anim_index = i + 1
+        self.anim_after_id = self.after(self.speed_ms.get(), self._anim_tick)
 
     def _highlight_node(self, node: Node, fill: str) -> None:
         item = self.node_items.get(node)
@@ -308,7 +349,12 @@ class GraphUI(tk.Tk):
         return str(node)
 
     def _str_to_node(self, text: str) -> Node:
-        # Try literal eval first to support tuples/ints
+        # The label cache covers every node of the current graph; fall back
+        # to literal_eval only for free-form input such as tuples/ints
+        g = self.graphs[self.current_graph_name.get()]
+        node = g.label_to_node.get(text)
+        if node is not None:
+            return node
         from ast import literal_eval
         try:
             return literal_eval(text)
@@ -330,12 +376,14 @@ class GraphUI(tk.Tk):
     def _auto_step(self) -> None:
         if not self.visited_order:
             return
-        def tick() -> None:
-            if self._step_index >= len(self.visited_order):
-                return
-            self._step_once()
-            self.after(max(50, self.speed_ms.get() // 2), tick)
-        tick()
+        self._auto_tick()
+
+    def _auto_tick(self) -> None:
+        if self._step_index >= len(self.visited_order):
+            return
+        self._step_once()
+        # reschedule the bound method directly -- no per-frame closure
+        self.after(max(50, self.speed_ms.get() // 2), self._auto_tick)
 
     # Zoom / Pan handlers
     def _on_wheel(self, event) -> None:
@@ -354,7 +402,10 @@ class GraphUI(tk.Tk):
         # keep cursor position stable while zooming
         self.pan_x = x - (x - self.pan_x) * (self.user_scale / old)
         self.pan_y = y - (y - self.pan_y) * (self.user_scale / old)
-        self._draw_graph()
+        # Scale the existing items in place; creating canvas items is far
+        # more expensive than transforming them. Bookkeeping above keeps
+        # later overlays (path animation) consistent with the item state.
+        self.canvas.scale("all", x, y, factor, factor)
 
     def _pan_start(self, event) -> None:
         self._pan_last = (event.x, event.y)
@@ -367,7 +418,9 @@ class GraphUI(tk.Tk):
         self.pan_x += dx
         self.pan_y += dy
         self._pan_last = (event.x, event.y)
-        self._draw_graph()
+        # Translate the existing items rather than rebuilding the scene;
+        # a full redraw only happens on resize or graph change.
+        self.canvas.move("all", dx, dy)
 
     def _pan_end(self, _event) -> None:
         self._pan_last = None